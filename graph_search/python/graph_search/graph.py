@@ -2,19 +2,20 @@
 Data structures for representing graphs
 """
 
-import copy
-from typing import List
+from typing import Iterable, Tuple
 
 class Vertex:
     """
     Represents a vertex in an immutable graph
     """
-    def __init__(self, children: List[Vertex]):
-        self._children = children
+    __slots__ = ('_children',)
+
+    def __init__(self, children: Iterable['Vertex']):
+        self._children = tuple(children)
 
     @property
-    def children(self):
+    def children(self) -> Tuple['Vertex', ...]:
         """
         Get the children of this node
         """
-        return copy.deepcopy(self._children)
+        return self._children
@@ -0,0 +1,100 @@
+"""
+Tests for the uninformed graph search algorithms
+"""
+
+import unittest
+from typing import List, Optional
+
+from graph_search.graph import Vertex
+from graph_search.uninformed import BreadthFirstSearch, DepthFirstSearch
+
+class RecordingBreadthFirstSearch(BreadthFirstSearch):
+    """
+    Breadth first search that records every vertex it visits
+    """
+
+    def __init__(self, goal: Vertex) -> None:
+        super().__init__(goal)
+        self.visited: List[Vertex] = []
+
+    def visit(self, vertex: Vertex) -> Optional[List[Vertex]]:
+        self.visited.append(vertex)
+        return super().visit(vertex)
+
+class State(Vertex):
+    """
+    Vertex that compares equal to any other state with the same name
+    """
+    __slots__ = ('_name',)
+
+    def __init__(self, name: str, children: List[Vertex]) -> None:
+        super().__init__(children)
+        self._name = name
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, State) and self._name == other._name
+
+    def __hash__(self) -> int:
+        return hash(self._name)
+
+class TestUninformedSearch(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # a -> [b, c], b -> [g], c -> [d], d -> [g]
+        self.g = Vertex([])
+        self.d = Vertex([self.g])
+        self.c = Vertex([self.d])
+        self.b = Vertex([self.g])
+        self.a = Vertex([self.b, self.c])
+
+    def assert_valid_path(self, path: Optional[List[Vertex]], start: Vertex, goal: Vertex) -> None:
+        assert path is not None
+        self.assertIs(path[0], start)
+        self.assertIs(path[-1], goal)
+        for parent, child in zip(path, path[1:]):
+            self.assertIn(child, parent.children)
+
+    def test_bfs_finds_shortest_path(self) -> None:
+        path = BreadthFirstSearch(self.g).search(self.a)
+        self.assertEqual(path, [self.a, self.b, self.g])
+
+    def test_dfs_finds_valid_path(self) -> None:
+        path = DepthFirstSearch(self.g).search(self.a)
+        self.assert_valid_path(path, self.a, self.g)
+
+    def test_start_is_goal(self) -> None:
+        for search_type in (BreadthFirstSearch, DepthFirstSearch):
+            self.assertEqual(search_type(self.a).search(self.a), [self.a])
+
+    def test_unreachable_goal(self) -> None:
+        for search_type in (BreadthFirstSearch, DepthFirstSearch):
+            self.assertIsNone(search_type(Vertex([])).search(self.a))
+
+    def test_shared_vertex_is_expanded_once(self) -> None:
+        search = RecordingBreadthFirstSearch(Vertex([]))
+        self.assertIsNone(search.search(self.a))
+        self.assertEqual(search.visited.count(self.g), 1)
+        self.assertEqual(len(search.visited), 5)
+
+    def test_visit_without_search(self) -> None:
+        self.assertEqual(BreadthFirstSearch(self.g).visit(self.g), [self.g])
+        search = BreadthFirstSearch(self.g)
+        self.assertIsNone(search.visit(self.a))
+        self.assertIsNone(search.visit(self.b))
+        self.assertEqual(search.visit(self.g), [self.a, self.b, self.g])
+
+    def test_goal_matched_by_equality(self) -> None:
+        goal = State('goal', [])
+        start = State('start', [State('goal', [])])
+        path = BreadthFirstSearch(goal).search(start)
+        assert path is not None
+        self.assertEqual(path, [start, goal])
+        self.assertIsNot(path[-1], goal)
+
+    def test_search_can_be_repeated(self) -> None:
+        search = BreadthFirstSearch(self.g)
+        self.assertEqual(search.search(self.a), [self.a, self.b, self.g])
+        self.assertEqual(search.search(self.c), [self.c, self.d, self.g])
+
+if __name__ == '__main__':
+    unittest.main()
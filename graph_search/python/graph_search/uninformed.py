@@ -2,8 +2,9 @@
 Pure python implementation of uninformed graph search algorithms
 """
 
-from abc import ABC
-import copy
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional
 
 from graph_search.graph import Vertex
 
@@ -13,16 +14,71 @@ class XFirstSearch(ABC):
     """
 
     def __init__(self, goal: Vertex):
-        self._goal = copy.deepcopy(goal)
-        self._path = [] : List[Vertex]
+        self._goal: Vertex = goal
+        self._parents: Dict[Vertex, Optional[Vertex]] = {}
+        self._to_visit: Deque[Vertex] = deque()
 
-    def visit(self, vertex: Vertex):
+    def search(self, start: Vertex) -> Optional[List[Vertex]]:
         """
-        Visits the providing vertex, and adds any children to the collection of nodes to visit next
+        Visits vertices reachable from the provided start vertex until the goal is found. Returns
+        the path from the start to the goal, or None if the goal is unreachable. Any state left by a
+        previous search is discarded
         """
+        self._parents = {start: None}
+        self._to_visit = deque([start])
+        while self._to_visit:
+            path = self.visit(self._next_to_visit())
+            if path is not None:
+                return path
+        return None
+
+    def visit(self, vertex: Vertex) -> Optional[List[Vertex]]:
+        """
+        Visits the providing vertex, and adds any children to the collection of nodes to visit next.
+        A vertex not discovered by an earlier visit is treated as a start of the search
+        """
+        self._parents.setdefault(vertex, None)
         if vertex == self._goal:
-            return self._path
-        self._expand_to_visit(vertex.children)
+            return self._path_to(vertex)
+        self._expand_to_visit(vertex, vertex.children)
+        return None
+
+    def _expand_to_visit(self, parent: Vertex, vertices: Iterable[Vertex]) -> None:
+        for vertex in vertices:
+            if vertex not in self._parents:
+                self._parents[vertex] = parent
+                self._to_visit.append(vertex)
+
+    def _path_to(self, vertex: Vertex) -> List[Vertex]:
+        """
+        Follows parent pointers back from the provided vertex to the start of the search
+        """
+        path: List[Vertex] = []
+        current: Optional[Vertex] = vertex
+        while current is not None:
+            path.append(current)
+            current = self._parents[current]
+        path.reverse()
+        return path
+
+    @abstractmethod
+    def _next_to_visit(self) -> Vertex:
+        """
+        Removes and returns the next vertex to visit from the collection of nodes to visit
+        """
+
+class BreadthFirstSearch(XFirstSearch):
+    """
+    Visits vertices in the order they were discovered
+    """
+
+    def _next_to_visit(self) -> Vertex:
+        return self._to_visit.popleft()
+
+class DepthFirstSearch(XFirstSearch):
+    """
+    Visits the most recently discovered vertex first
+    """
 
-    def _expand_to_visit(self, vertices: List[Vertex]):
-        self.kkkkkkkkkkk
+    def _next_to_visit(self) -> Vertex:
+        return self._to_visit.pop()
@@ -1,15 +1,23 @@
-from setuptools import setup
+from pathlib import Path
+
+from setuptools import setup, find_packages
+
+try:
+    long_description = Path(__file__).with_name('README.md').read_text()
+except FileNotFoundError:
+    long_description = ''
 
 setup(
     name='graph_search',
     version='0.1.0',
     author='T. F. W. Nicholson',
     author_email='tfwnicholson@gmail.com',
-    packages=['graph_search', 'graph_search.test'],
+    packages=find_packages(),
     scripts=[],
     # url='none_yet',
     license='../../LICENSE',
     description='Implementation of graph search algorithms',
-    long_description=open('README.md').read(),
+    long_description=long_description,
+    python_requires='>=3.6.1',
     install_requires=[],
 )